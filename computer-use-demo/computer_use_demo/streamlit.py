@@ -10,7 +10,6 @@ import traceback
 from contextlib import contextmanager
 from datetime import datetime, timedelta
 from enum import StrEnum
-from functools import partial
 from pathlib import PosixPath
 from typing import cast
 
@@ -222,6 +221,22 @@ async def main():
             # we don't have a user message to respond to, exit early
             return
 
+        tool_state = st.session_state.tools
+        response_state = st.session_state.responses
+
+        def output_callback(message: BetaContentBlockParam):
+            _render_message(Sender.BOT, message)
+
+        def tool_output_callback(tool_output: ToolResult, tool_id: str):
+            _tool_output_callback(tool_output, tool_id, tool_state)
+
+        def api_response_callback(
+            request: httpx.Request,
+            response: httpx.Response | object | None,
+            error: Exception | None,
+        ):
+            _api_response_callback(request, response, error, http_logs, response_state)
+
         with track_sampling_loop():
             # run the agent sampling loop with the newest message
             st.session_state.messages = await sampling_loop(
@@ -229,15 +244,9 @@ async def main():
                 model=st.session_state.model,
                 provider=st.session_state.provider,
                 messages=st.session_state.messages,
-                output_callback=partial(_render_message, Sender.BOT),
-                tool_output_callback=partial(
-                    _tool_output_callback, tool_state=st.session_state.tools
-                ),
-                api_response_callback=partial(
-                    _api_response_callback,
-                    tab=http_logs,
-                    response_state=st.session_state.responses,
-                ),
+                output_callback=output_callback,
+                tool_output_callback=tool_output_callback,
+                api_response_callback=api_response_callback,
                 api_key=st.session_state.api_key,
                 only_n_most_recent_images=st.session_state.only_n_most_recent_images,
             )
@@ -332,7 +341,9 @@ def _api_response_callback(
     """
     Handle an API response by storing it to state and rendering it.
     """
-    response_id = datetime.now().isoformat()
+    # the sequence number keeps ids unique and ordered, as entries are never removed
+    # from response_state; the timestamp is formatted once here for the label
+    response_id = f"{len(response_state)} @ {datetime.now().isoformat()}"
     response_state[response_id] = (request, response)
     if error:
         _render_error(error)
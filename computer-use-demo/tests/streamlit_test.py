@@ -4,7 +4,7 @@ import pytest
 from anthropic.types import TextBlockParam
 from streamlit.testing.v1 import AppTest
 
-from computer_use_demo.streamlit import Sender
+from computer_use_demo.streamlit import Sender, _api_response_callback
 
 
 @pytest.fixture
@@ -25,3 +25,21 @@ def test_streamlit(streamlit_app: AppTest):
             }
         ]
         assert not streamlit_app.exception
+
+
+def test_api_response_callback_ids():
+    response_state = {}
+    requests = [mock.Mock(), mock.Mock()]
+    responses = [mock.Mock(), mock.Mock()]
+    with mock.patch(
+        "computer_use_demo.streamlit._render_api_response"
+    ) as render_patch, mock.patch("computer_use_demo.streamlit._render_error"):
+        for request, response in zip(requests, responses, strict=True):
+            _api_response_callback(request, response, None, mock.Mock(), response_state)
+
+    response_ids = list(response_state)
+    assert len(set(response_ids)) == 2
+    assert response_ids[0].startswith("0 @ ")
+    assert response_ids[1].startswith("1 @ ")
+    assert list(response_state.values()) == list(zip(requests, responses, strict=True))
+    assert render_patch.call_count == 2